@@ -2,8 +2,8 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import datetime
 import os
-import json
-from ecourts import search_by_cnr, search_by_case, get_cause_list_for_court, download_file, check_listing_in_causelist
+from concurrent.futures import ThreadPoolExecutor
+from ecourts import FETCH_POOL, fetch_causelist_pdf, search_by_cnr, search_by_case, get_cause_list_for_court, download_files, check_listing_in_causelist, dumps_json
 
 
 class ECourtsGUI:
@@ -12,6 +12,8 @@ class ECourtsGUI:
         self.root.title("eCourts Scraper")
         self.root.geometry("800x600")
         self.root.resizable(False, False)
+        # Network calls run here so the Tk event loop never blocks on them.
+        self.executor = ThreadPoolExecutor(max_workers=4)
 
         self.tab_control = ttk.Notebook(root)
         self.tab_control.pack(expand=1, fill='both')
@@ -54,7 +56,8 @@ class ECourtsGUI:
         ttk.Checkbutton(options_frame, text="Tomorrow", variable=self.tomorrow_var).pack(side="left", padx=5)
         ttk.Checkbutton(options_frame, text="Download PDF", variable=self.pdf_var).pack(side="left", padx=5)
 
-        ttk.Button(frame, text="Run Search", command=self.run_search).pack(pady=5)
+        self.search_button = ttk.Button(frame, text="Run Search", command=self.run_search)
+        self.search_button.pack(pady=5)
 
         self.output_text = scrolledtext.ScrolledText(frame, wrap='word', height=20)
         self.output_text.pack(fill="both", padx=10, pady=5)
@@ -65,7 +68,8 @@ class ECourtsGUI:
         self.cl_out_path = tk.StringVar()
         ttk.Entry(frame, textvariable=self.cl_out_path, width=50).pack(side="left", padx=5, pady=5)
         ttk.Button(frame, text="Browse", command=self.browse_file).pack(side="left", padx=5)
-        ttk.Button(frame, text="Download", command=self.download_causelist).pack(side="left", padx=5)
+        self.download_button = ttk.Button(frame, text="Download", command=self.download_causelist)
+        self.download_button.pack(side="left", padx=5)
 
  
     def browse_file(self):
@@ -73,50 +77,81 @@ class ECourtsGUI:
         if path:
             self.cl_out_path.set(path)
 
+    def _submit(self, work, on_done, button):
+        button.state(["disabled"])
+        fut = self.executor.submit(work)
+        self.root.after(100, lambda: self._poll(fut, on_done, button))
+
+    def _poll(self, fut, on_done, button):
+        if not fut.done():
+            self.root.after(100, lambda: self._poll(fut, on_done, button))
+            return
+        button.state(["!disabled"])
+        try:
+            result = fut.result()
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        on_done(result)
+
     def run_search(self):
         self.output_text.delete(1.0, tk.END)
-        output = {"query": {}, "results": None}
         cnr = self.cnr_entry.get().strip()
         case_type = self.case_type_entry.get().strip()
         number = self.case_no_entry.get().strip()
         year = self.case_year_entry.get().strip()
+        today = self.today_var.get()
+        tomorrow = self.tomorrow_var.get()
+        want_pdf = self.pdf_var.get()
 
-        try:
+        if not cnr and not (case_type and number and year):
+            messagebox.showerror("Input Error", "Enter either CNR or Case Type/Number/Year")
+            return
+
+        def work():
+            output = {"query": {}, "results": None}
+            date = None
+            if today or tomorrow:
+                date = datetime.date.today() if today else datetime.date.today() + datetime.timedelta(days=1)
             if cnr:
                 output["query"]["cnr"] = cnr
-                res = search_by_cnr(cnr)
+                f_case = FETCH_POOL.submit(search_by_cnr, cnr)
+                f_cl = FETCH_POOL.submit(get_cause_list_for_court, date=date) if date else None
+                res = f_case.result()
                 output["results"] = res
-                if self.today_var.get() or self.tomorrow_var.get():
-                    date = datetime.date.today() if self.today_var.get() else datetime.date.today() + datetime.timedelta(days=1)
-                    cl = get_cause_list_for_court(date=date)
+                if f_cl:
+                    cl = f_cl.result()
                     output["cause_list_attempt"] = cl
                     if cl.get("ok") and cl.get("pdfs"):
-                        pdf_url = cl["pdfs"][0]
-                        found = check_listing_in_causelist(pdf_url, {"cnr": cnr})
-                        output["found_in_causelist"] = found
-                if self.pdf_var.get() and res.get("info") and res["info"].get("pdf_links"):
+                        data = fetch_causelist_pdf(cl["pdfs"][0])
+                        if data:
+                            output["found_in_causelist"] = check_listing_in_causelist(data, {"cnr": cnr})
+                if want_pdf and res.get("info") and res["info"].get("pdf_links"):
                     os.makedirs("downloads", exist_ok=True)
-                    for i, pdf in enumerate(res["info"]["pdf_links"]):
-                        fname = os.path.join("downloads", f"{cnr}_doc_{i+1}.pdf")
-                        download_file(pdf, fname)
-
-            elif case_type and number and year:
+                    download_files([
+                        (pdf, os.path.join("downloads", f"{cnr}_doc_{i+1}.pdf"))
+                        for i, pdf in enumerate(res["info"]["pdf_links"])
+                    ])
+            else:
                 output["query"]["case_type"] = case_type
                 output["query"]["number"] = number
                 output["query"]["year"] = year
-                res = search_by_case(case_type, number, year)
+                f_case = FETCH_POOL.submit(search_by_case, case_type, number, year)
+                f_cl = FETCH_POOL.submit(get_cause_list_for_court, date=date) if date else None
+                res = f_case.result()
                 output["results"] = res
-                if self.today_var.get() or self.tomorrow_var.get():
-                    date = datetime.date.today() if self.today_var.get() else datetime.date.today() + datetime.timedelta(days=1)
-                    cl = get_cause_list_for_court(date=date)
-                    output["cause_list_attempt"] = cl
-            else:
-                messagebox.showerror("Input Error", "Enter either CNR or Case Type/Number/Year")
-                return
+                if f_cl:
+                    output["cause_list_attempt"] = f_cl.result()
+            return output
 
-            self.output_text.insert(tk.END, json.dumps(output, indent=2))
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        def show(output):
+            # Insert in slices so Tk lays out the text incrementally.
+            text = dumps_json(output).decode("utf-8")
+            for i in range(0, len(text), 65536):
+                self.output_text.insert(tk.END, text[i:i + 65536])
+                self.output_text.update_idletasks()
+
+        self._submit(work, show, self.search_button)
 
 
     def download_causelist(self):
@@ -124,13 +159,17 @@ class ECourtsGUI:
         if not path:
             messagebox.showwarning("Output Path", "Select an output file path first!")
             return
-        cl = get_cause_list_for_court(date=datetime.date.today())
-        write_json(path, cl)
-        messagebox.showinfo("Done", f"Cause list saved -> {path}")
+
+        def work():
+            cl = get_cause_list_for_court(date=datetime.date.today())
+            write_json(path, cl)
+            return cl
+
+        self._submit(work, lambda cl: messagebox.showinfo("Done", f"Cause list saved -> {path}"), self.download_button)
 
 def write_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(path, "wb") as f:
+        f.write(dumps_json(data))
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,82 +1,373 @@
 
 import argparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import json
+import re
 import os
 import datetime
-from urllib.parse import urljoin, urlencode
-from typing import Optional, Dict, Any, List
+import hashlib
+import io
+import itertools
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlencode, urlsplit
+from typing import Optional, Dict, Any, List, Tuple
+
+try:
+    from diskcache import Cache
+except ImportError:  # caching is optional; without it every call hits the network
+    Cache = None
+
+try:
+    import ahocorasick
+except ImportError:  # falls back to a compiled regex alternation
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # stdlib json is used as the (slower) fallback
+    orjson = None
+
+try:
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+    from pdfminer.pdftypes import PDFException
+    from pdfminer.psparser import PSException
+    _PDF_ERRORS = (PDFException, PSException)
+except ImportError:  # only needed to scan PDF cause lists
+    extract_pages = None
+    _PDF_ERRORS = ()
+
+try:
+    import brotli  # noqa: F401 -- lets urllib3 decode "br" responses
+    _ACCEPT_ENCODING = "gzip, br, deflate"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
 
 BASE = "https://services.ecourts.gov.in/ecourtindia_v6/"
 HEADERS = {
-    "User-Agent": "ecourts-scraper/1.0 (+https://github.com/yourname/ecourts-scraper)"
+    "User-Agent": "ecourts-scraper/1.0 (+https://github.com/yourname/ecourts-scraper)",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "Accept": "text/html,application/xhtml+xml,application/pdf;q=0.9,*/*;q=0.8",
+    "Connection": "keep-alive",
 }
 
-def safe_get(url: str, params: dict = None, timeout: int = 15) -> Optional[requests.Response]:
+_PDF_ANY = re.compile(r"\.pdf(?:$|[?#])", re.I)
+_CL_PDF = re.compile(r"\.pdf.*cause|cause.*\.pdf", re.I)
+# Serial is the first all-digit token, so "45/2021" in the case cell never counts.
+_SERIAL_RE = re.compile(r"(?<!\S)(\d+)(?!\S)")
+# Pages where only links are consumed are parsed down to their anchors.
+_ANCHORS = SoupStrainer("a", href=True)
+
+# One pooled session for every request so repeated hits on the eCourts host
+# reuse the same keep-alive connection instead of a fresh TCP+TLS handshake.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+# Transient 5xx/connection errors are retried inside urllib3 on the pooled
+# connection; the final 5xx response is handed back rather than raised.
+_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD"]),
+    raise_on_status=False,
+)
+_ADAPTER = HTTPAdapter(max_retries=_RETRIES, pool_connections=8, pool_maxsize=16)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Shared worker pool for independent fetches (case page + cause list, PDF batches).
+FETCH_POOL = ThreadPoolExecutor(max_workers=8)
+
+CACHE_DIR = ".ecourts_cache"
+CASE_TTL = 24 * 3600        # case details rarely change within a day
+CAUSE_LIST_TTL = 300        # cause-list index is republished during the day
+REVALIDATE_TTL = 7 * 24 * 3600  # how long a stale entry is kept for conditional GETs
+MAX_CAUSELIST_BYTES = 20 * 1024 * 1024  # larger cause lists are not worth scanning
+MIN_CAUSELIST_BYTES = 1024              # smaller bodies are error pages, not PDFs
+try:
+    NEG_TTL = int(os.environ.get("ECOURTS_NEG_TTL", "300"))
+except ValueError:
+    print("[WARN] Ignoring invalid ECOURTS_NEG_TTL; using 300s")
+    NEG_TTL = 300
+_CACHE = Cache(CACHE_DIR) if Cache else None
+# "No cause list yet" answers, kept briefly so repeated checks don't refetch.
+_NEG_CACHE: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+
+
+def safe_get(url: str, params: dict = None, timeout: int = 15, headers: dict = None, allow_4xx: bool = False) -> Optional[requests.Response]:
+    """GET through the retrying session; logs and returns None once retries are exhausted.
+
+    With ``allow_4xx`` a client-error response is returned instead of None, so
+    callers can tell "the server said no" apart from a failed connection.
+    """
     try:
-        r = requests.get(url, params=params, headers=HEADERS, timeout=timeout)
+        r = _SESSION.get(url, params=params, headers=headers, timeout=timeout)
+        if allow_4xx and 400 <= r.status_code < 500:
+            return r
         r.raise_for_status()
         return r
-    except Exception as e:
+    except requests.RequestException as e:
         print(f"[ERROR] Request failed for {url} -> {e}")
         return None
 
 
+def _cache_key(url: str, params: dict = None) -> tuple:
+    return ("GET", url, tuple(sorted((params or {}).items())))
+
+
+def _response_from_cache(url: str, entry: dict) -> requests.Response:
+    r = requests.Response()
+    r.status_code = entry["status"]
+    r.url = url
+    r.headers = CaseInsensitiveDict({"Content-Type": entry["content_type"]})
+    r._content = entry["body"]
+    r.encoding = requests.utils.get_encoding_from_headers(r.headers)
+    return r
+
+
+def cached_get(url: str, params: dict = None, ttl: int = 3600, timeout: int = 15, allow_4xx: bool = False) -> Optional[requests.Response]:
+    """safe_get backed by the on-disk cache; only successful responses are stored.
+
+    Entries are served directly for ``ttl`` seconds. After that, if the server
+    sent an ETag or Last-Modified, the entry is revalidated with a conditional
+    GET and a bodiless 304 reuses the cached body.
+    """
+    if _CACHE is None:
+        return safe_get(url, params=params, timeout=timeout, allow_4xx=allow_4xx)
+    key = _cache_key(url, params)
+    entry = _CACHE.get(key)
+    if not isinstance(entry, dict):  # nothing cached, or a pre-revalidation entry
+        entry = None
+    now = time.time()
+    if entry and now < entry["fresh_until"]:
+        return _response_from_cache(url, entry)
+
+    headers = {}
+    if entry and entry["etag"]:
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry["last_modified"]:
+        headers["If-Modified-Since"] = entry["last_modified"]
+    r = safe_get(url, params=params, timeout=timeout, headers=headers or None, allow_4xx=allow_4xx)
+    if r is None:
+        return None
+    if r.status_code == 304 and entry:
+        entry["fresh_until"] = now + ttl
+        _CACHE.set(key, entry, expire=REVALIDATE_TTL)
+        return _response_from_cache(url, entry)
+    if r.ok:
+        entry = {
+            "status": r.status_code,
+            "content_type": r.headers.get("Content-Type", ""),
+            "body": r.content,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "fresh_until": now + ttl,
+        }
+        # Without validators a stale entry is useless, so drop it at ttl.
+        keep = REVALIDATE_TTL if entry["etag"] or entry["last_modified"] else ttl
+        _CACHE.set(key, entry, expire=keep)
+    return r
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def write_json(path: str, data: Any):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(path, "wb") as f:
+        f.write(dumps_json(data))
     print(f"Saved JSON -> {path}")
 
 
-def download_file(url: str, out_path: str) -> bool:
-    r = safe_get(url)
-    if not r:
+def _pdf_cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, "pdfs", hashlib.sha1(url.encode("utf-8")).hexdigest() + ".pdf")
+
+
+def _write_chunks(chunks, out_path: str, sha256: str = None) -> bool:
+    # Stream into a temp file beside out_path and rename it into place, so a
+    # dropped connection or a bad checksum never leaves a partial file.
+    digest = hashlib.sha256() if sha256 else None
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(out_path) or ".", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for c in chunks:
+                if c:
+                    f.write(c)
+                    if digest:
+                        digest.update(c)
+        if digest and digest.hexdigest() != sha256.lower():
+            os.remove(tmp)
+            print(f"[ERROR] Checksum mismatch for {out_path}")
+            return False
+        os.replace(tmp, out_path)
+        return True
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _pdf_cache_fresh(path: str) -> bool:
+    try:
+        return time.time() - os.path.getmtime(path) < CASE_TTL
+    except OSError:
         return False
+
+
+def _store_pdf_cache(src: str, cached: str):
+    # Copy to a temp file and rename, so an interrupted copy never leaves a
+    # truncated PDF that later runs would serve.
+    os.makedirs(os.path.dirname(cached), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(cached), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, open(src, "rb") as fin:
+            shutil.copyfileobj(fin, f)
+        os.replace(tmp, cached)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def download_file(url: str, out_path: str, chunk: int = 65536, sha256: str = None) -> bool:
+    """Stream url to out_path without buffering the body; optionally verify its SHA-256."""
+    cached = _pdf_cache_path(url) if _CACHE is not None else None
     try:
-        with open(out_path, "wb") as f:
-            f.write(r.content)
+        if cached and _pdf_cache_fresh(cached):
+            with open(cached, "rb") as src:
+                ok = _write_chunks(iter(lambda: src.read(chunk), b""), out_path, sha256)
+            if ok:
+                print(f"Downloaded (cached) -> {out_path}")
+                return True
+        with _SESSION.get(url, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            if not _write_chunks(r.iter_content(chunk), out_path, sha256):
+                return False
+        if cached:
+            _store_pdf_cache(out_path, cached)
         print(f"Downloaded -> {out_path}")
         return True
     except Exception as e:
-        print(f"[ERROR] Failed to save file: {e}")
+        print(f"[ERROR] Failed to download {url} -> {e}")
         return False
 
+
+def _read_capped(url: str, chunks) -> Optional[bytes]:
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        if len(buf) > MAX_CAUSELIST_BYTES:
+            print(f"[WARN] Skipping cause list {url} (over {MAX_CAUSELIST_BYTES} bytes)")
+            return None
+    return bytes(buf)
+
+
+def fetch_causelist_pdf(url: str) -> Optional[bytes]:
+    """Fetch a cause-list PDF for scanning, probing size and magic bytes before the full GET."""
+    try:
+        h = _SESSION.head(url, allow_redirects=True, timeout=15)
+        size = int(h.headers.get("Content-Length", 0)) if h.ok else 0
+        if size > MAX_CAUSELIST_BYTES or 0 < size < MIN_CAUSELIST_BYTES:
+            print(f"[WARN] Skipping cause list {url} ({size} bytes)")
+            return None
+        # identity: a compressed partial body can't be decoded on its own.
+        probe_headers = {"Range": "bytes=0-4", "Accept-Encoding": "identity"}
+        with _SESSION.get(url, headers=probe_headers, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            chunks = r.iter_content(65536)
+            first = next(chunks, b"")
+            if not first.startswith(b"%PDF"):
+                print(f"[WARN] Skipping cause list {url} (not a PDF)")
+                return None
+            if r.status_code != 206:
+                # Range was ignored and the full body is already streaming in.
+                return _read_capped(url, itertools.chain([first], chunks))
+        with _SESSION.get(url, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            return _read_capped(url, r.iter_content(65536))
+    except (requests.RequestException, ValueError) as e:
+        print(f"[ERROR] Failed to fetch cause list {url} -> {e}")
+        return None
+
+
+def download_files(pairs: List[Tuple[str, str]]) -> List[bool]:
+    """Download several (url, out_path) pairs concurrently over the shared session."""
+    return list(FETCH_POOL.map(lambda p: download_file(p[0], p[1]), pairs))
+
+
+def unique_urls(urls: List[str]) -> List[str]:
+    """Drop repeated links, keeping the first original spelling of each; order is kept.
+
+    Links count as repeats when they differ only in scheme/host case, a
+    trailing slash or a #fragment. That normalized form is only the
+    comparison key; the URLs returned are the ones passed in.
+    """
+    seen = {}
+    for u in urls:
+        parts = urlsplit(u)
+        # The fragment is never sent to the server, so x.pdf#page=2 is x.pdf.
+        key = (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query)
+        seen.setdefault(key, u)
+    return list(seen.values())
+
+
+def _cnr_heading(soup: BeautifulSoup) -> Optional[str]:
+    for h in soup.find_all(["h1", "h2", "h3"]):
+        txt = h.get_text()
+        if "CNR" in txt:
+            return txt.strip()
+    return None
+
+
 def search_by_cnr(cnr: str) -> Dict[str, Any]:
     print(f"Searching for CNR: {cnr}")
     params = {"cnr": cnr}
 
     json_guess = urljoin(BASE, "?p=casejson&cnr=")
-    r = safe_get(urljoin(BASE, f"?p=casestatus%2Fcase_details&cnr={cnr}"))
+    r = cached_get(urljoin(BASE, f"?p=casestatus%2Fcase_details&cnr={cnr}"), ttl=CASE_TTL)
     if r and r.headers.get("Content-Type", "").startswith("application/json"):
         try:
             return r.json()
         except Exception:
             pass
 
-    r = safe_get(urljoin(BASE, f"?p=casestatus%2Findex&cnr={cnr}"))
+    # The case_details page usually already carries the case; only fall back
+    # to the index page when it is missing or lacks the CNR heading.
+    soup = title = None
+    if r:
+        soup = BeautifulSoup(r.text, "lxml")
+        title = _cnr_heading(soup)
+    if title is None:
+        r = cached_get(urljoin(BASE, f"?p=casestatus%2Findex&cnr={cnr}"), ttl=CASE_TTL)
+        soup = None
     result = {"cnr": cnr, "found": False, "raw": None}
     if not r:
         return result
     html = r.text
     result["raw"] = html[:5000] 
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(html, "lxml")
+        title = _cnr_heading(soup)
     info = {}
-    title = soup.find(lambda t: t.name in ["h1", "h2", "h3"] and "CNR" in t.text)
     if title:
-        info["title"] = title.text.strip()
+        info["title"] = title
 
-    pdf_links = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if href.lower().endswith(".pdf"):
-            pdf_links.append(urljoin(BASE, href))
+    is_pdf = _PDF_ANY.search
+    pdf_links = unique_urls([urljoin(BASE, a["href"]) for a in soup.find_all("a", href=True) if is_pdf(a["href"])])
     if pdf_links:
         info["pdf_links"] = pdf_links
 
-    texts = soup.get_text(separator="|", strip=True)
-    if "cause list" in texts.lower() or "listed" in texts.lower():
+    texts = soup.get_text(separator="|", strip=True).lower()
+    if "cause list" in texts or "listed" in texts:
         info["page_mentions_listing"] = True
 
     result.update({"found": True, "info": info})
@@ -92,68 +383,152 @@ def search_by_case(case_type: str, number: str, year: str) -> Dict[str, Any]:
         "case_year": year
     }
 
-    r = safe_get(urljoin(BASE, "?p=casestatus%2Findex"), params=params)
+    r = cached_get(urljoin(BASE, "?p=casestatus%2Findex"), params=params, ttl=CASE_TTL)
     if not r:
         return {"found": False}
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = BeautifulSoup(r.text, "lxml", parse_only=_ANCHORS)
+    ct_low = case_type.lower()
+    base, _urljoin = BASE, urljoin
     results = []
     for a in soup.find_all("a", href=True):
-        href = a["href"]
         text = a.get_text(strip=True)
-        if case_type.lower() in text.lower() or number in text or year in text:
-            results.append({"text": text, "href": urljoin(BASE, href)})
+        if ct_low in text.lower() or number in text or year in text:
+            results.append({"text": text, "href": _urljoin(base, a["href"])})
     return {"found": bool(results), "results": results}
 
 
 def get_cause_list_for_court(state: str = None, district: str = None, court_complex: str = None, date: datetime.date = None) -> Dict[str, Any]:
  
     date = date or datetime.date.today()
+    key = (state, district, court_complex, date.isoformat())
+    neg = _NEG_CACHE.get(key)
+    if neg and time.monotonic() - neg[0] < NEG_TTL:
+        return neg[1]
+
     print(f"Attempting to fetch cause list for {date.isoformat()} (may require captcha).")
-    r = safe_get(urljoin(BASE, "?p=cause_list%2Findex"))
-    if not r:
+    r = cached_get(urljoin(BASE, "?p=cause_list%2Findex"), ttl=CAUSE_LIST_TTL, allow_4xx=True)
+    if r is None:  # connection error, timeout or 5xx: worth retrying next call
         return {"ok": False, "reason": "Failed to load cause list index"}
-    soup = BeautifulSoup(r.text, "html.parser")
+    if not r.ok:
+        result = {"ok": False, "reason": f"Cause list index returned HTTP {r.status_code}"}
+        _NEG_CACHE[key] = (time.monotonic(), result)
+        return result
+    soup = BeautifulSoup(r.text, "lxml", parse_only=_ANCHORS)
 
-    pdfs = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if ".pdf" in href.lower() and "cause" in href.lower():
-            pdfs.append(urljoin(BASE, href))
+    is_cause_pdf = _CL_PDF.search
+    pdfs = unique_urls([urljoin(BASE, a["href"]) for a in soup.find_all("a", href=True) if is_cause_pdf(a["href"])])
     if pdfs:
         return {"ok": True, "pdfs": pdfs}
-    return {"ok": False, "reason": "No direct cause-list PDFs found (captcha likely required)"}
-
-
-def check_listing_in_causelist(causelist_html: str, case_identifiers: Dict[str, str]) -> Optional[Dict[str, str]]:
-    
-    soup = BeautifulSoup(causelist_html, "html.parser")
-    text = soup.get_text(separator="|", strip=True).lower()
-
-    if "cnr" in case_identifiers and case_identifiers["cnr"]:
-        cnr = case_identifiers["cnr"].lower()
-        if cnr in text:
-
-            for line in text.split("|"):
-                if cnr in line:
-                    tokens = line.split()
-                    serial = None
-                    court = None
-                   
-                    for tok in tokens:
-                        if tok.isdigit():
-                            serial = tok
-                            break
-                    return {"serial": serial or "?", "court": court or "?", "line": line}
+    result = {"ok": False, "reason": "No direct cause-list PDFs found (captcha likely required)"}
+    _NEG_CACHE[key] = (time.monotonic(), result)
+    return result
+
+
+class CauseListError(Exception):
+    """A cause list could not be read, as opposed to a case not being listed in it."""
+
+
+def pdf_text_iter(data: bytes):
+    """Yield the text of each PDF page lazily, so a scan that stops early skips later pages."""
+    if extract_pages is None:
+        raise CauseListError("pdfminer.six is required to scan PDF cause lists")
+    try:
+        for page in extract_pages(io.BytesIO(data)):
+            yield "".join(el.get_text() for el in page if isinstance(el, LTTextContainer))
+    except _PDF_ERRORS as e:
+        raise CauseListError(f"Unreadable cause-list PDF: {e}") from e
+
+
+def _causelist_text(content):
+    if isinstance(content, bytes) and content[:4] == b"%PDF":
+        return pdf_text_iter(content)
+    return iter([BeautifulSoup(content, "lxml").get_text("\n")])
 
+
+def _listing_needles(case_identifiers: Dict[str, str]) -> List[str]:
+    needles = []
+    if case_identifiers.get("cnr"):
+        needles.append(case_identifiers["cnr"].lower())
     if "number" in case_identifiers and "year" in case_identifiers:
-        needle = f"{case_identifiers['number']}/{case_identifiers['year']}"
-        if needle.lower() in text:
-            for line in text.split("|"):
-                if needle.lower() in line:
-                    tokens = line.split()
-                    serial = next((t for t in tokens if t.isdigit()), None)
-                    return {"serial": serial or "?", "court": "?", "line": line}
-    return None
+        needles.append(f"{case_identifiers['number']}/{case_identifiers['year']}".lower())
+    return needles
+
+
+def _build_matcher(needles):
+    """Compile needles once: an Aho-Corasick automaton, or a regex fallback without it."""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for n in needles:
+            automaton.add_word(n, n)
+        automaton.make_automaton()
+        return automaton
+    # A zero-width lookahead finds every offset where some needle starts, so
+    # matches may overlap just like the automaton's.
+    needles = sorted(needles, key=len, reverse=True)
+    return re.compile("(?=(?:%s))" % "|".join(map(re.escape, needles))), needles
+
+
+def _iter_matches(text: str, matcher):
+    """Yield (start, end, needle) for every needle occurrence in one pass over text."""
+    if isinstance(matcher, tuple):
+        pat, needles = matcher
+        for m in pat.finditer(text):
+            pos = m.start()
+            # Several needles can start at one offset (one a prefix of another).
+            for n in needles:
+                if text.startswith(n, pos):
+                    yield pos, pos + len(n), n
+    else:
+        for end_idx, n in matcher.iter(text):
+            yield end_idx - len(n) + 1, end_idx + 1, n
+
+
+def _listing_hit(text: str, start: int, end: int) -> Dict[str, str]:
+    # Widen the hit to its enclosing line rather than leading a pattern
+    # with [^\n]*, which would rescan from every offset.
+    eol = text.find("\n", end)
+    line = text[text.rfind("\n", 0, start) + 1:eol if eol != -1 else None].strip()
+    serial = _SERIAL_RE.search(line)
+    return {"serial": serial.group(1) if serial else "?", "court": "?", "line": line}
+
+
+def check_listings_in_causelist(content, case_identifiers_list: List[Dict[str, str]]) -> List[Optional[Dict[str, str]]]:
+    """Look up many cases in one cause list (HTML text or raw PDF bytes) with a single scan.
+
+    Returns one entry per input, in order: the first matching line, None when
+    the case is not listed, or ``{"error": ...}`` when the list could not be read.
+    """
+    results: List[Optional[Dict[str, str]]] = [None] * len(case_identifiers_list)
+    owners: Dict[str, List[int]] = {}
+    for i, ids in enumerate(case_identifiers_list):
+        for n in _listing_needles(ids):
+            owners.setdefault(n, []).append(i)
+    if not owners:
+        return results
+
+    pending = len({i for idxs in owners.values() for i in idxs})
+    matcher = _build_matcher(owners)
+    try:
+        for text in _causelist_text(content):
+            low = text.lower()
+            for start, end, needle in _iter_matches(low, matcher):
+                for i in owners[needle]:
+                    if results[i] is None:
+                        results[i] = _listing_hit(low, start, end)
+                        pending -= 1
+                if not pending:
+                    return results
+    except CauseListError as e:
+        print(f"[ERROR] {e}")
+        # Cases not yet found are unknown, not "not listed".
+        failed = {i for idxs in owners.values() for i in idxs if results[i] is None}
+        for i in failed:
+            results[i] = {"error": str(e)}
+    return results
+
+
+def check_listing_in_causelist(content, case_identifiers: Dict[str, str]) -> Optional[Dict[str, str]]:
+    return check_listings_in_causelist(content, [case_identifiers])[0]
 
 
 def main():
@@ -170,46 +545,51 @@ def main():
     args = parser.parse_args()
 
     output = {"query": {}, "results": None}
+    date = None
+    if args.today or args.tomorrow:
+        date = datetime.date.today() if args.today else datetime.date.today() + datetime.timedelta(days=1)
 
     if args.cnr:
         output["query"]["cnr"] = args.cnr
-        res = search_by_cnr(args.cnr)
+        # Case page and cause-list index are independent; fetch them together.
+        f_case = FETCH_POOL.submit(search_by_cnr, args.cnr)
+        f_cl = FETCH_POOL.submit(get_cause_list_for_court, date=date) if date else None
+        res = f_case.result()
         output["results"] = res
        
-        if args.today or args.tomorrow:
-            date = datetime.date.today() if args.today else datetime.date.today() + datetime.timedelta(days=1)
-            cl = get_cause_list_for_court(date=date)
+        if f_cl:
+            cl = f_cl.result()
             output["cause_list_attempt"] = cl
             if cl.get("ok") and cl.get("pdfs"):
                 # download first pdf and scan
-                pdf_url = cl["pdfs"][0]
-                r = safe_get(pdf_url)
-                if r:
-                    found = check_listing_in_causelist(r.text, {"cnr": args.cnr})
+                data = fetch_causelist_pdf(cl["pdfs"][0])
+                if data:
+                    found = check_listing_in_causelist(data, {"cnr": args.cnr})
                     output["found_in_causelist"] = found
      
         if args.download_pdf and res.get("info") and res["info"].get("pdf_links"):
             os.makedirs("downloads", exist_ok=True)
-            for i, pdf in enumerate(res["info"]["pdf_links"]):
-                fname = os.path.join("downloads", f"{args.cnr}_doc_{i+1}.pdf")
-                download_file(pdf, fname)
+            download_files([
+                (pdf, os.path.join("downloads", f"{args.cnr}_doc_{i+1}.pdf"))
+                for i, pdf in enumerate(res["info"]["pdf_links"])
+            ])
 
     elif args.case:
         case_type, number, year = args.case
         output["query"]["case_type"] = case_type
         output["query"]["number"] = number
         output["query"]["year"] = year
-        res = search_by_case(case_type, number, year)
+        f_case = FETCH_POOL.submit(search_by_case, case_type, number, year)
+        f_cl = FETCH_POOL.submit(get_cause_list_for_court, date=date) if date else None
+        res = f_case.result()
         output["results"] = res
-        if args.today or args.tomorrow:
-            date = datetime.date.today() if args.today else datetime.date.today() + datetime.timedelta(days=1)
-            cl = get_cause_list_for_court(date=date)
+        if f_cl:
+            cl = f_cl.result()
             output["cause_list_attempt"] = cl
             if cl.get("ok") and cl.get("pdfs"):
-                pdf_url = cl["pdfs"][0]
-                r = safe_get(pdf_url)
-                if r:
-                    found = check_listing_in_causelist(r.text, {"number": number, "year": year})
+                data = fetch_causelist_pdf(cl["pdfs"][0])
+                if data:
+                    found = check_listing_in_causelist(data, {"number": number, "year": year})
                     output["found_in_causelist"] = found
 
     if args.causelist:
@@ -218,9 +598,10 @@ def main():
         # If PDF(s) found, download them
         if cl.get("ok") and cl.get("pdfs"):
             os.makedirs("cause_lists", exist_ok=True)
-            for i, pdf in enumerate(cl["pdfs"]):
-                outp = os.path.join("cause_lists", f"cause_list_{i+1}.pdf")
-                download_file(pdf, outp)
+            download_files([
+                (pdf, os.path.join("cause_lists", f"cause_list_{i+1}.pdf"))
+                for i, pdf in enumerate(cl["pdfs"])
+            ])
 
 
     write_json(args.out, output)